@@ -0,0 +1,171 @@
+# Benchmark suite for the dashboard pages — loads synthetic data once, then
+# runs each page's feature engineering and stages (kpis, aggregation,
+# correlation, chart_data) from utils/page_data.py, the same functions the
+# pages call, and reports wall time and peak memory per page and stage.
+#
+# Pages run one at a time and each page's frame is freed before the next, so
+# peak memory is the raw frame plus one page's working copy. That is still
+# about MEMORY_PER_ROW bytes per row — ~1.4 GB at 300k rows, ~14 GB at 3M and
+# ~135 GB at 30M. Sizes that don't fit in physical memory are skipped unless
+# --force is given.
+#
+# Usage:
+#   python benchmark.py                         # 300k, 3M and 30M rows
+#   python benchmark.py --rows 300000           # a single size
+#   python benchmark.py --update-baseline       # store results as the baseline
+#
+# Wall times come from a pass without tracemalloc (it slows these stages by
+# ~15-20%, see perf.py); peak memory comes from a second, traced pass.
+#
+# Exits with status 1 when a stage regresses against benchmark_baseline.json
+# or is missing from the results, and with status 2 when there is no
+# baseline to compare against. The committed baseline covers 300k rows.
+import argparse
+import json
+import os
+import sys
+import time
+import tracemalloc
+
+from utils.load_data import load_data
+from utils.page_data import PAGES
+from synthetic_data import write_synthetic_csv
+
+SIZES = [300_000, 3_000_000, 30_000_000]
+DATA_DIR = "bench_data"
+BASELINE_PATH = "benchmark_baseline.json"
+# A stage regresses when it is both TOLERANCE slower / larger than the
+# baseline and above the noise floor below.
+TOLERANCE = 0.25
+MIN_WALL_DELTA_S = 0.05
+MIN_PEAK_DELTA_MB = 16
+# Peak process memory per row of application_train, measured on synthetic data
+MEMORY_PER_ROW = 4500
+
+
+# ------------------------------
+# Runner
+# ------------------------------
+def synthetic_csv(rows):
+    path = os.path.join(DATA_DIR, f"application_train_{rows}.csv")
+    if not os.path.exists(path):
+        os.makedirs(DATA_DIR, exist_ok=True)
+        print(f"Generating {rows:,} synthetic rows -> {path}")
+        write_synthetic_csv(path + ".tmp", rows)
+        os.replace(path + ".tmp", path)
+    return path
+
+
+def physical_memory():
+    """Physical memory in bytes, or None where the platform doesn't say."""
+    try:
+        return os.sysconf("SC_PAGE_SIZE") * os.sysconf("SC_PHYS_PAGES")
+    except (AttributeError, ValueError, OSError):
+        return None
+
+
+def time_stage(run):
+    start = time.perf_counter()
+    value = run()
+    return value, {"wall_s": round(time.perf_counter() - start, 4)}
+
+
+def trace_stage(run):
+    tracemalloc.reset_peak()
+    base, _ = tracemalloc.get_traced_memory()
+    value = run()
+    _, peak = tracemalloc.get_traced_memory()
+    return value, {"peak_mb": round((peak - base) / 2**20, 1)}
+
+
+def run_pages(csv, measure):
+    """Run the load and every page stage once, measuring each with ``measure``."""
+    results = {}
+
+    def stage(name, run):
+        value, results[name] = measure(run)
+        return value
+
+    raw = stage("load", lambda: load_data(csv))
+    for slug, _, features, stages in PAGES:
+        df = stage(f"{slug}/features", lambda: features(raw.copy()))
+        data = {}
+        for name, run in stages:
+            data[name] = stage(f"{slug}/{name}", lambda: run(df, data))
+        # Free this page's frame before the next page copies raw.
+        del df, data
+    return results
+
+
+def run_size(rows):
+    csv = synthetic_csv(rows)
+    wall = run_pages(csv, time_stage)
+    tracemalloc.start()
+    try:
+        peak = run_pages(csv, trace_stage)
+    finally:
+        tracemalloc.stop()
+    results = {name: {**wall[name], **peak[name]} for name in wall}
+    for name, r in results.items():
+        print(f"  {name:<24} {r['wall_s']:9.3f} s  {r['peak_mb']:10.1f} MB")
+    return results
+
+
+def find_regressions(results, baseline):
+    regressions = []
+    for rows, stages in results.items():
+        for name in baseline.get(rows, {}):
+            if name not in stages:
+                regressions.append(f"{rows} rows / {name}: in the baseline but not measured")
+        for name, current in stages.items():
+            previous = baseline.get(rows, {}).get(name)
+            if previous is None:
+                continue
+            for key, floor in [("wall_s", MIN_WALL_DELTA_S), ("peak_mb", MIN_PEAK_DELTA_MB)]:
+                delta = current[key] - previous[key]
+                if delta > floor and delta > previous[key] * TOLERANCE:
+                    regressions.append(f"{rows} rows / {name}: {key} {previous[key]} -> {current[key]}")
+    return regressions
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark the dashboard pages on synthetic data.")
+    parser.add_argument("--rows", type=int, action="append", help="row count (repeatable); default 300k, 3M, 30M")
+    parser.add_argument("--baseline", default=BASELINE_PATH, help="baseline JSON to compare against")
+    parser.add_argument("--update-baseline", action="store_true", help="write results to the baseline file")
+    parser.add_argument("--force", action="store_true", help="run sizes that don't fit in physical memory")
+    args = parser.parse_args()
+
+    results = {}
+    memory = physical_memory()
+    for rows in args.rows or SIZES:
+        needed = rows * MEMORY_PER_ROW
+        if memory is not None and needed > memory and not args.force:
+            print(f"Skipping {rows:,} rows: needs ~{needed / 2**30:.0f} GB, "
+                  f"{memory / 2**30:.0f} GB available (use --force to run anyway)")
+            continue
+        print(f"{rows:,} rows")
+        results[str(rows)] = run_size(rows)
+
+    baseline = {}
+    if os.path.exists(args.baseline):
+        with open(args.baseline, encoding="utf-8") as f:
+            baseline = json.load(f)
+    elif not args.update_baseline:
+        print(f"No baseline at {args.baseline}; run with --update-baseline to create one")
+        sys.exit(2)
+
+    if args.update_baseline:
+        baseline.update(results)
+        with open(args.baseline, "w", encoding="utf-8") as f:
+            json.dump(baseline, f, indent=2)
+        print(f"Baseline written to {args.baseline}")
+        sys.exit(0)
+
+    for rows in results:
+        if rows not in baseline:
+            print(f"No baseline for {rows} rows; not compared")
+    regressions = find_regressions(results, baseline)
+    for line in regressions:
+        print(f"REGRESSION {line}")
+    sys.exit(1 if regressions else 0)
@@ -0,0 +1,185 @@
+# Static snapshot export — runs every dashboard page once against a dataset
+# version and writes the KPIs as JSON plus pre-rendered charts into an HTML
+# bundle that any file server can serve without running Python per view.
+#
+# Usage:
+#   python export_snapshot.py --csv application_train.csv --out snapshot
+#   python export_snapshot.py --workers 4      # render pages on a warm worker pool
+#
+# See worker_pool.py for how workers share the dataset and the memory that
+# --workers needs.
+#
+# The bundle is only regenerated when the dataset changes (use --force to
+# rebuild anyway). A rebuild never breaks the bundle being served: charts are
+# rendered into a new charts-* directory, index.html and kpis.json are then
+# swapped in atomically, and only after that are the old charts removed.
+import argparse
+import hashlib
+import html
+import json
+import math
+import os
+import shutil
+import tempfile
+from datetime import datetime, timezone
+
+import pandas as pd
+import numpy as np
+import matplotlib
+matplotlib.use("Agg")
+
+import worker_pool
+from utils.load_data import CSV_PATH, load_data
+from utils.page_charts import CHARTS, plt
+from utils.page_data import KPI_FORMATS, PAGES, format_kpis
+
+
+# ------------------------------
+# Helpers
+# ------------------------------
+def dataset_version(path):
+    """Content hash of the CSV, used to decide whether to rebuild."""
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            h.update(chunk)
+    return h.hexdigest()[:16]
+
+
+def snapshot_version(kpi_path):
+    """Dataset version of an existing bundle, or None if kpis.json is missing or unreadable."""
+    try:
+        with open(kpi_path, encoding="utf-8") as f:
+            return json.load(f).get("dataset_version")
+    except (OSError, ValueError, AttributeError):
+        return None
+
+
+def write_atomic(path, text):
+    tmp = path + ".tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        f.write(text)
+    os.replace(tmp, path)
+
+
+def to_jsonable(value):
+    """Convert pandas / numpy values into plain JSON types (NaN / ±inf -> null)."""
+    if isinstance(value, pd.Series):
+        return {str(k): to_jsonable(v) for k, v in value.items()}
+    if isinstance(value, dict):
+        return {str(k): to_jsonable(v) for k, v in value.items()}
+    if isinstance(value, np.generic):
+        value = value.item()
+    if isinstance(value, float) and not math.isfinite(value):
+        return None
+    return value
+
+
+# ------------------------------
+# Export
+# ------------------------------
+def render_html(snapshot):
+    parts = [
+        "<!DOCTYPE html>",
+        "<html><head><meta charset='utf-8'><title>Home Credit Dashboard (snapshot)</title>",
+        "<style>body{font-family:sans-serif;margin:2em}"
+        "table{border-collapse:collapse;margin-bottom:1em}td{border:1px solid #ddd;padding:4px 8px}"
+        "figure{display:inline-block;width:48%;margin:4px}img{width:100%}</style></head><body>",
+        f"<p>Dataset version <code>{snapshot['dataset_version']}</code>, "
+        f"generated {snapshot['generated_at']}</p>",
+    ]
+    for page in snapshot["pages"]:
+        parts.append(f"<h1>{html.escape(page['title'])}</h1>")
+        for caption, rows in [("KPIs", page["kpi_display"])] + list(page["tables"].items()):
+            parts.append(f"<table><caption>{html.escape(caption)}</caption>")
+            for name, value in rows.items():
+                parts.append(f"<tr><td>{html.escape(name)}</td><td>{html.escape(str(value))}</td></tr>")
+            parts.append("</table>")
+        parts.append("<div>")
+        for chart in page["charts"]:
+            parts.append(f"<figure><img src='{chart['file']}' alt='{html.escape(chart['title'])}'>"
+                         f"<figcaption>{html.escape(chart['title'])}</figcaption></figure>")
+        parts.append("</div>")
+    parts.append("</body></html>")
+    return "\n".join(parts)
+
+
+def export_page(page, raw, out_dir, chart_dir):
+    """Compute and render one entry of PAGES against the raw dataset."""
+    slug, title, features, stages = page
+    df = features(raw.copy())
+    data = {}
+    for stage, run in stages:
+        data[stage] = run(df, data)
+
+    tables = {}
+    for result in data.values():
+        tables.update(result.get("tables", {}))
+
+    charts = []
+    for i, (chart_title, fig) in enumerate(CHARTS[slug](df, data["chart_data"]), start=1):
+        name = f"{chart_dir}/{slug}-{i:02d}.png"
+        fig.savefig(os.path.join(out_dir, name), bbox_inches="tight")
+        plt.close(fig)
+        charts.append({"title": chart_title, "file": name})
+    print(f"{slug}: {len(charts)} charts")
+    return {
+        "page": slug,
+        "title": title,
+        "kpis": to_jsonable({k: v for k, v in data["kpis"].items() if k != "tables"}),
+        "kpi_display": format_kpis(data["kpis"], KPI_FORMATS[slug]),
+        "tables": to_jsonable(tables),
+        "charts": charts,
+    }
+
+
+def _export_page_in_worker(index, out_dir, chart_dir):
+    return export_page(PAGES[index], worker_pool.dataset(), out_dir, chart_dir)
+
+
+def export_snapshot(csv_path, out_dir, force=False, workers=0):
+    version = dataset_version(csv_path)
+    kpi_path = os.path.join(out_dir, "kpis.json")
+    if not force and snapshot_version(kpi_path) == version:
+        print(f"Snapshot for dataset {version} is up to date: {out_dir}")
+        return False
+
+    # A fresh charts-* directory per build; the one the current index.html
+    # points at stays in place until the new index.html is swapped in.
+    os.makedirs(out_dir, exist_ok=True)
+    chart_dir = os.path.basename(tempfile.mkdtemp(prefix="charts-", dir=out_dir))
+    os.chmod(os.path.join(out_dir, chart_dir), 0o755)
+
+    snapshot = {
+        "dataset_version": version,
+        "generated_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "pages": [],
+    }
+    if workers:
+        # Pages render in parallel on workers that already hold the dataset
+        # and a warm matplotlib font cache.
+        with worker_pool.warm_pool(csv_path, workers) as pool:
+            n = len(PAGES)
+            snapshot["pages"] = list(pool.map(_export_page_in_worker, range(n), [out_dir] * n, [chart_dir] * n))
+    else:
+        raw = load_data(csv_path)
+        snapshot["pages"] = [export_page(page, raw, out_dir, chart_dir) for page in PAGES]
+
+    write_atomic(os.path.join(out_dir, "index.html"), render_html(snapshot))
+    # kpis.json is swapped in last so an interrupted run is rebuilt next time
+    write_atomic(kpi_path, json.dumps(snapshot, indent=2, ensure_ascii=False, allow_nan=False))
+    for name in os.listdir(out_dir):
+        if (name == "charts" or name.startswith("charts-")) and name != chart_dir:
+            shutil.rmtree(os.path.join(out_dir, name), ignore_errors=True)
+    print(f"Snapshot for dataset {version} written to {out_dir}")
+    return True
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Export a static dashboard snapshot.")
+    parser.add_argument("--csv", default=CSV_PATH, help="application_train.csv to snapshot")
+    parser.add_argument("--out", default="snapshot", help="output directory for the HTML bundle")
+    parser.add_argument("--force", action="store_true", help="rebuild even if the dataset is unchanged")
+    parser.add_argument("--workers", type=int, default=0, help="render pages on a pool of pre-warmed workers")
+    args = parser.parse_args()
+    export_snapshot(args.csv, args.out, force=args.force, workers=args.workers)
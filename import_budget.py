@@ -0,0 +1,113 @@
+# Import-time budget for every entry point.
+#
+# For each script, the module-level imports (and lazy_import() assignments)
+# are run in a fresh interpreter and timed, both in eager mode and with
+# DASHBOARD_LAZY_IMPORTS=1. The lazy-mode time is checked against
+# import_budget.json. An entry point whose imports fail only because a
+# third-party package isn't installed here is reported as SKIP and keeps its
+# recorded budget on --update; any other import error (a missing local
+# module, a name that no longer exists, an exception at import) fails the
+# check.
+#
+# Usage:
+#   python import_budget.py            # measure and check against the budget
+#   python import_budget.py --update   # record measured times (+ headroom) as the budget
+import argparse
+import ast
+import json
+import os
+import re
+import subprocess
+import sys
+
+ENTRY_POINTS = ["main.py", "home.py", "overview.py", "target.py", "financial.py", "corelation.py"]
+BUDGET_PATH = "import_budget.json"
+REPEATS = 3
+HEADROOM = 1.5
+
+
+def startup_code(path):
+    """The imports and lazy_import() assignments at the top level of ``path``."""
+    with open(path, encoding="utf-8") as f:
+        tree = ast.parse(f.read(), filename=path)
+    nodes = []
+    for node in tree.body:
+        if isinstance(node, (ast.Import, ast.ImportFrom)):
+            nodes.append(node)
+        elif (isinstance(node, ast.Assign) and isinstance(node.value, ast.Call)
+              and isinstance(node.value.func, ast.Name) and node.value.func.id == "lazy_import"):
+            nodes.append(node)
+    return ast.unparse(ast.Module(body=nodes, type_ignores=[]))
+
+
+class ImportFailed(Exception):
+    """A third-party package the entry point imports isn't installed here."""
+
+
+def missing_package(error, root):
+    """Top-level name of the third-party package behind a ModuleNotFoundError, else None."""
+    match = re.match(r"ModuleNotFoundError: No module named '([^']+)'", error)
+    if not match:
+        return None
+    name = match.group(1).split(".")[0]
+    if os.path.exists(os.path.join(root, name + ".py")) or os.path.isdir(os.path.join(root, name)):
+        return None
+    return name
+
+
+def measure(path, lazy):
+    """Best-of-REPEATS seconds to run the startup code of ``path`` in a fresh interpreter."""
+    code = "import time\n_t = time.perf_counter()\n" + startup_code(path) + "\nprint(time.perf_counter() - _t)\n"
+    env = dict(os.environ, DASHBOARD_LAZY_IMPORTS="1" if lazy else "0")
+    root = os.path.dirname(os.path.abspath(path))
+    times = []
+    for _ in range(REPEATS):
+        result = subprocess.run([sys.executable, "-c", code], env=env, capture_output=True, text=True, cwd=root)
+        if result.returncode != 0:
+            error = result.stderr.strip().splitlines()[-1]
+            package = missing_package(error, root)
+            if package:
+                raise ImportFailed(f"{package} is not installed")
+            raise RuntimeError(error)
+        times.append(float(result.stdout.strip().splitlines()[-1]))
+    return min(times)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Measure entry-point import times against a budget.")
+    parser.add_argument("--budget", default=BUDGET_PATH, help="budget JSON (seconds per entry point)")
+    parser.add_argument("--update", action="store_true", help="write measured lazy-mode times as the budget")
+    args = parser.parse_args()
+
+    budget = {}
+    if os.path.exists(args.budget):
+        with open(args.budget, encoding="utf-8") as f:
+            budget = json.load(f)
+
+    measured, failures = {}, []
+    print(f"{'entry point':<16}{'eager s':>10}{'lazy s':>10}{'budget s':>10}")
+    for entry in ENTRY_POINTS:
+        try:
+            eager, lazy = measure(entry, lazy=False), measure(entry, lazy=True)
+        except ImportFailed as e:
+            print(f"{entry:<16}SKIP {e}")
+            continue
+        except RuntimeError as e:
+            print(f"{entry:<16}FAIL")
+            failures.append(f"{entry}: import failed ({e})")
+            continue
+        measured[entry] = lazy
+        limit = budget.get(entry)
+        print(f"{entry:<16}{eager:>10.3f}{lazy:>10.3f}{limit if limit is not None else '-':>10}")
+        if limit is not None and lazy > limit:
+            failures.append(f"{entry}: {lazy:.3f} s over budget of {limit} s")
+
+    if args.update:
+        budget.update({entry: round(t * HEADROOM, 3) for entry, t in measured.items()})
+        with open(args.budget, "w", encoding="utf-8") as f:
+            json.dump(budget, f, indent=2)
+        print(f"Budget written to {args.budget}")
+
+    for line in failures:
+        print(f"FAIL {line}")
+    sys.exit(1 if failures else 0)
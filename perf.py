@@ -0,0 +1,155 @@
+# Lightweight stage instrumentation for the dashboard pages.
+#
+# Each page calls begin() at the top, lap("<stage>") after every block it
+# wants measured, and finish() at the end. A lap records the wall time and
+# CPU time since the previous lap, so wrapping a page needs no re-indentation.
+#
+# Everything is a no-op unless DASHBOARD_PERF=1 is set. When enabled:
+#   * a developer sidebar shows the stages of the current rerun
+#   * DASHBOARD_PERF_JSONL=<path> appends one JSON line per rerun
+#   * prometheus_text() / the sidebar download exposes Prometheus text format
+# Wall and CPU timing costs a couple of microseconds per lap and is safe to
+# leave on in production.
+#
+# DASHBOARD_PERF_ALLOC=1 additionally records tracemalloc allocation deltas
+# per lap. That is for local profiling only: tracemalloc hooks every Python
+# allocation for the whole process (the page stages in utils/page_data.py
+# run ~15-20% slower and the traces use extra memory), it is started on the
+# first rerun and stays on, and it is process-wide — allocation deltas
+# include whatever other Streamlit sessions allocate concurrently, and every
+# lap's reset_peak() clears the peak that a concurrent session is measuring.
+import json
+import os
+import threading
+import time
+import tracemalloc
+from collections import deque
+
+ENABLED = os.environ.get("DASHBOARD_PERF", "") not in ("", "0")
+ALLOC = ENABLED and os.environ.get("DASHBOARD_PERF_ALLOC", "") not in ("", "0")
+JSONL_PATH = os.environ.get("DASHBOARD_PERF_JSONL")
+HISTORY_SIZE = 500
+
+_history = deque(maxlen=HISTORY_SIZE)
+# (page, stage) -> [runs, wall_s, cpu_s, alloc_bytes] since process start;
+# unlike _history these never drop old reruns, so the counters are monotonic.
+_totals = {}
+_lock = threading.Lock()
+_local = threading.local()
+
+
+def _sample():
+    current = tracemalloc.get_traced_memory()[0] if ALLOC else None
+    return time.perf_counter(), time.thread_time(), current
+
+
+def begin(page):
+    """Start a new rerun of ``page``."""
+    if not ENABLED:
+        return
+    if ALLOC:
+        if not tracemalloc.is_tracing():
+            tracemalloc.start()
+        tracemalloc.reset_peak()
+    _local.rerun = {"page": page, "timestamp": time.time(), "stages": []}
+    _local.mark = _sample()
+
+
+def lap(stage):
+    """Record everything since the previous lap (or begin) as ``stage``."""
+    rerun = getattr(_local, "rerun", None)
+    if rerun is None:
+        return
+    wall, cpu, current = _sample()
+    start_wall, start_cpu, start_current = _local.mark
+    record = {
+        "stage": stage,
+        "wall_s": wall - start_wall,
+        "cpu_s": cpu - start_cpu,
+        "alloc_bytes": None,
+        "peak_alloc_bytes": None,
+    }
+    if ALLOC:
+        _, peak = tracemalloc.get_traced_memory()
+        record["alloc_bytes"] = current - start_current
+        record["peak_alloc_bytes"] = peak - start_current
+        tracemalloc.reset_peak()
+    rerun["stages"].append(record)
+    _local.mark = _sample()
+
+
+def finish():
+    """Close the current rerun, export it and show the developer sidebar."""
+    rerun = getattr(_local, "rerun", None)
+    if rerun is None:
+        return None
+    _local.rerun = None
+    with _lock:
+        _history.append(rerun)
+        for s in rerun["stages"]:
+            t = _totals.setdefault((rerun["page"], s["stage"]), [0, 0.0, 0.0, 0])
+            t[0] += 1
+            t[1] += s["wall_s"]
+            t[2] += s["cpu_s"]
+            t[3] += max(s["alloc_bytes"] or 0, 0)
+        if JSONL_PATH:
+            with open(JSONL_PATH, "a", encoding="utf-8") as f:
+                f.write(json.dumps(rerun) + "\n")
+    show_sidebar(rerun)
+    return rerun
+
+
+# ------------------------------
+# Export
+# ------------------------------
+def to_jsonl(reruns=None):
+    with _lock:
+        reruns = list(_history) if reruns is None else reruns
+    return "".join(json.dumps(r) + "\n" for r in reruns)
+
+
+def _label(value):
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def prometheus_text():
+    """Totals per (page, stage) since process start, Prometheus text format."""
+    with _lock:
+        totals = {key: list(t) for key, t in _totals.items()}
+
+    metrics = [
+        ("dashboard_stage_runs_total", "Number of times the stage ran.", 0),
+        ("dashboard_stage_wall_seconds_total", "Wall time spent in the stage.", 1),
+        ("dashboard_stage_cpu_seconds_total", "CPU time spent in the stage.", 2),
+    ]
+    if ALLOC:
+        metrics.append(("dashboard_stage_alloc_bytes_total",
+                        "Positive net bytes allocated by the stage (laps that freed memory add 0).", 3))
+    lines = []
+    for name, help_text, i in metrics:
+        lines.append(f"# HELP {name} {help_text}")
+        lines.append(f"# TYPE {name} counter")
+        for (page, stage), t in sorted(totals.items()):
+            lines.append(f'{name}{{page="{_label(page)}",stage="{_label(stage)}"}} {t[i]}')
+    return "\n".join(lines) + "\n"
+
+
+def show_sidebar(rerun):
+    import streamlit as st
+
+    with st.sidebar.expander("⏱ Performance (dev)", expanded=False):
+        st.table([
+            {
+                "stage": s["stage"],
+                "wall ms": round(s["wall_s"] * 1000, 1),
+                "cpu ms": round(s["cpu_s"] * 1000, 1),
+                **({
+                    "alloc MB": round(s["alloc_bytes"] / 2**20, 2),
+                    "peak MB": round(s["peak_alloc_bytes"] / 2**20, 2),
+                } if ALLOC else {}),
+            }
+            for s in rerun["stages"]
+        ])
+        st.caption(f"Total {sum(s['wall_s'] for s in rerun['stages']):.2f} s over {len(rerun['stages'])} stages")
+        st.download_button("Download JSON lines", to_jsonl(), file_name="perf.jsonl")
+        st.download_button("Download Prometheus text", prometheus_text(), file_name="perf.prom")
@@ -0,0 +1,55 @@
+# Cold-start helper: deferred heavy imports.
+#
+# With DASHBOARD_LAZY_IMPORTS=1, lazy_import() returns a placeholder module
+# that only imports the real one (and runs its on_load hook, e.g. sns.set) the
+# first time an attribute is used. Without it, modules are imported straight
+# away exactly as a plain ``import`` would.
+#
+# The pages draw charts on every run, so lazy mode does not reduce the total
+# import work of a page: matplotlib / seaborn are still imported before the
+# first chart. What it buys is time to first KPI — the title and metrics
+# render before the plotting stack is loaded. Every page imports this module,
+# so it must stay cheap to import (the worker pool lives in worker_pool.py).
+import importlib
+import os
+import threading
+import types
+
+LAZY = os.environ.get("DASHBOARD_LAZY_IMPORTS", "") not in ("", "0")
+
+
+class _LazyModule(types.ModuleType):
+    def __init__(self, name, on_load):
+        super().__init__(name)
+        self.__dict__["_on_load"] = on_load
+        self.__dict__["_module"] = None
+        self.__dict__["_lock"] = threading.Lock()
+
+    def _load(self):
+        with self._lock:
+            if self._module is None:
+                module = importlib.import_module(self.__name__)
+                if self._on_load:
+                    self._on_load(module)
+                self.__dict__["_module"] = module
+        return self._module
+
+    def __getattr__(self, attr):
+        return getattr(self._load(), attr)
+
+
+def lazy_import(name, on_load=None):
+    """Import ``name`` now, or on first attribute access when LAZY is set."""
+    if not LAZY:
+        module = importlib.import_module(name)
+        if on_load:
+            on_load(module)
+        return module
+    return _LazyModule(name, on_load)
+
+
+def load(module):
+    """Force a module returned by lazy_import() to be imported."""
+    if isinstance(module, _LazyModule):
+        return module._load()
+    return module
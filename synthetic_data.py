@@ -0,0 +1,275 @@
+# Synthetic application_train.csv generator — reproduces the columns, dtypes
+# and quirks the dashboard pages rely on without shipping real applicant data:
+#   * TARGET imbalance (~8% defaults)
+#   * all 122 columns, in the order of the real file
+#   * DAYS_EMPLOYED 365243 sentinel for exactly the pensioners / unemployed
+#     (~18%), who also get ORGANIZATION_TYPE "XNA", no OCCUPATION_TYPE and
+#     FLAG_EMP_PHONE 0
+#   * NAME_* / CODE_GENDER / OCCUPATION_TYPE / ORGANIZATION_TYPE / *_MODE
+#     categories and frequencies
+#   * per-column missing-value rates (EXT_SOURCE_*, OWN_CAR_AGE, building info,
+#     social circle, credit bureau)
+#
+# Usage:
+#   python synthetic_data.py --rows 300000 --out synthetic_300k.csv
+import argparse
+
+import pandas as pd
+import numpy as np
+
+CHUNK_ROWS = 500_000
+FIRST_ID = 100002
+DAYS_EMPLOYED_SENTINEL = 365243
+DEFAULT_RATE = 0.0807
+# NAME_INCOME_TYPE values that carry the DAYS_EMPLOYED sentinel
+NOT_EMPLOYED = ["Pensioner", "Unemployed"]
+# OCCUPATION_TYPE missing rate among employed applicants (31% overall)
+OCCUPATION_MISSING = 0.163
+
+# column -> (categories, probabilities); None marks a missing value
+CATEGORICALS = {
+    "NAME_CONTRACT_TYPE": (["Cash loans", "Revolving loans"], [0.905, 0.095]),
+    "CODE_GENDER": (["F", "M", "XNA"], [0.65834, 0.34165, 0.00001]),
+    "FLAG_OWN_CAR": (["N", "Y"], [0.66, 0.34]),
+    "FLAG_OWN_REALTY": (["Y", "N"], [0.694, 0.306]),
+    "NAME_TYPE_SUITE": (
+        ["Unaccompanied", "Family", "Spouse, partner", "Children", "Other_B", None, "Other_A", "Group of people"],
+        [0.8082, 0.1305, 0.0370, 0.0106, 0.0058, 0.0042, 0.0028, 0.0009],
+    ),
+    "NAME_INCOME_TYPE": (
+        ["Working", "Commercial associate", "Pensioner", "State servant",
+         "Unemployed", "Student", "Businessman", "Maternity leave"],
+        [0.51632, 0.23289, 0.18003, 0.07058, 0.00007, 0.00006, 0.00003, 0.00002],
+    ),
+    "NAME_EDUCATION_TYPE": (
+        ["Secondary / secondary special", "Higher education", "Incomplete higher",
+         "Lower secondary", "Academic degree"],
+        [0.7102, 0.2434, 0.0334, 0.0124, 0.0006],
+    ),
+    "NAME_FAMILY_STATUS": (
+        ["Married", "Single / not married", "Civil marriage", "Separated", "Widow", "Unknown"],
+        [0.63879, 0.14778, 0.09683, 0.06429, 0.05230, 0.00001],
+    ),
+    "NAME_HOUSING_TYPE": (
+        ["House / apartment", "With parents", "Municipal apartment",
+         "Rented apartment", "Office apartment", "Co-op apartment"],
+        [0.8873, 0.0483, 0.0364, 0.0159, 0.0085, 0.0036],
+    ),
+    "OCCUPATION_TYPE": (
+        ["Laborers", "Sales staff", "Core staff", "Managers", "Drivers",
+         "High skill tech staff", "Accountants", "Medicine staff", "Security staff",
+         "Cooking staff", "Cleaning staff", "Private service staff", "Low-skill Laborers",
+         "Waiters/barmen staff", "Secretaries", "Realty agents", "HR staff", "IT staff"],
+        [0.1794, 0.1044, 0.0897, 0.0695, 0.0605, 0.0369, 0.0319, 0.0278, 0.0219,
+         0.0193, 0.0151, 0.0086, 0.0068, 0.0044, 0.0042, 0.0024, 0.0018, 0.0017],
+    ),
+    "WEEKDAY_APPR_PROCESS_START": (
+        ["TUESDAY", "WEDNESDAY", "MONDAY", "THURSDAY", "FRIDAY", "SATURDAY", "SUNDAY"],
+        [0.1751, 0.1689, 0.1649, 0.1645, 0.1637, 0.1101, 0.0528],
+    ),
+    # "XNA" is assigned to the NOT_EMPLOYED rows, not drawn
+    "ORGANIZATION_TYPE": (
+        ["Business Entity Type 3", "Self-employed", "Other", "Medicine", "Business Entity Type 2",
+         "Government", "School", "Trade: type 7", "Kindergarten", "Construction",
+         "Business Entity Type 1", "Transport: type 4", "Trade: type 3", "Industry: type 9",
+         "Industry: type 3", "Security", "Housing", "Industry: type 11", "Military", "Bank",
+         "Agriculture", "Police", "Transport: type 2", "Postal", "Security Ministries",
+         "Trade: type 2", "Restaurant", "Services", "University", "Industry: type 7",
+         "Transport: type 3", "Industry: type 1", "Hotel", "Electricity", "Industry: type 4",
+         "Trade: type 6", "Industry: type 5", "Insurance", "Telecom", "Emergency",
+         "Industry: type 2", "Advertising", "Realtor", "Culture", "Industry: type 12",
+         "Trade: type 1", "Mobile", "Legal Services", "Cleaning", "Transport: type 1",
+         "Industry: type 6", "Industry: type 10", "Religion", "Industry: type 13",
+         "Trade: type 4", "Trade: type 5", "Industry: type 8"],
+        [0.2211, 0.1249, 0.0543, 0.0364, 0.0343, 0.0338, 0.0289, 0.0255, 0.0224, 0.0219,
+         0.0195, 0.0176, 0.0114, 0.0110, 0.0107, 0.0106, 0.0096, 0.0088, 0.0086, 0.0082,
+         0.0080, 0.0076, 0.0072, 0.0070, 0.0064, 0.0062, 0.0059, 0.0051, 0.0043, 0.0043,
+         0.0039, 0.0034, 0.0031, 0.0031, 0.0029, 0.0021, 0.0019, 0.0019, 0.0019, 0.0018,
+         0.0015, 0.0014, 0.0013, 0.0012, 0.0012, 0.0011, 0.0010, 0.0010, 0.0008, 0.0007,
+         0.0004, 0.0004, 0.0003, 0.0002, 0.0002, 0.0002, 0.0001],
+    ),
+    "FONDKAPREMONT_MODE": (
+        [None, "reg oper account", "reg oper spec account", "not specified", "org spec account"],
+        [0.6839, 0.2400, 0.0393, 0.0185, 0.0183],
+    ),
+    "HOUSETYPE_MODE": (
+        [None, "block of flats", "specific housing", "terraced house"],
+        [0.5018, 0.4894, 0.0049, 0.0039],
+    ),
+    "WALLSMATERIAL_MODE": (
+        [None, "Panel", "Stone, brick", "Block", "Wooden", "Mixed", "Monolithic", "Others"],
+        [0.5084, 0.2144, 0.2107, 0.0301, 0.0174, 0.0075, 0.0058, 0.0057],
+    ),
+    "EMERGENCYSTATE_MODE": ([None, "No", "Yes"], [0.4740, 0.5185, 0.0075]),
+}
+
+# 0/1 flag column -> share of ones
+FLAG_COLUMNS = {
+    "FLAG_MOBIL": 1.0,
+    "FLAG_WORK_PHONE": 0.1994,
+    "FLAG_CONT_MOBILE": 0.9981,
+    "FLAG_PHONE": 0.2811,
+    "FLAG_EMAIL": 0.0567,
+    "REG_REGION_NOT_LIVE_REGION": 0.0151,
+    "REG_REGION_NOT_WORK_REGION": 0.0508,
+    "LIVE_REGION_NOT_WORK_REGION": 0.0406,
+    "REG_CITY_NOT_LIVE_CITY": 0.0782,
+    "REG_CITY_NOT_WORK_CITY": 0.2305,
+    "LIVE_CITY_NOT_WORK_CITY": 0.1796,
+}
+
+# building statistic -> missing rate; each has _AVG, _MODE and _MEDI columns
+# drawn from [0, 1) and missing together
+BUILDING_COLUMNS = {
+    "APARTMENTS": 0.5075,
+    "BASEMENTAREA": 0.5852,
+    "YEARS_BEGINEXPLUATATION": 0.4878,
+    "YEARS_BUILD": 0.6650,
+    "COMMONAREA": 0.6987,
+    "ELEVATORS": 0.5330,
+    "ENTRANCES": 0.5035,
+    "FLOORSMAX": 0.4976,
+    "FLOORSMIN": 0.6785,
+    "LANDAREA": 0.5938,
+    "LIVINGAPARTMENTS": 0.6835,
+    "LIVINGAREA": 0.5019,
+    "NONLIVINGAPARTMENTS": 0.6943,
+    "NONLIVINGAREA": 0.5518,
+}
+TOTALAREA_MISSING = 0.4827
+SOCIAL_CIRCLE_MISSING = 0.0033
+
+CREDIT_BUREAU_COLUMNS = [
+    "AMT_REQ_CREDIT_BUREAU_HOUR", "AMT_REQ_CREDIT_BUREAU_DAY", "AMT_REQ_CREDIT_BUREAU_WEEK",
+    "AMT_REQ_CREDIT_BUREAU_MON", "AMT_REQ_CREDIT_BUREAU_QRT", "AMT_REQ_CREDIT_BUREAU_YEAR",
+]
+CREDIT_BUREAU_MISSING = 0.135
+
+# Column order of the real application_train.csv
+COLUMNS = (
+    ["SK_ID_CURR", "TARGET", "NAME_CONTRACT_TYPE", "CODE_GENDER", "FLAG_OWN_CAR", "FLAG_OWN_REALTY",
+     "CNT_CHILDREN", "AMT_INCOME_TOTAL", "AMT_CREDIT", "AMT_ANNUITY", "AMT_GOODS_PRICE",
+     "NAME_TYPE_SUITE", "NAME_INCOME_TYPE", "NAME_EDUCATION_TYPE", "NAME_FAMILY_STATUS",
+     "NAME_HOUSING_TYPE", "REGION_POPULATION_RELATIVE", "DAYS_BIRTH", "DAYS_EMPLOYED",
+     "DAYS_REGISTRATION", "DAYS_ID_PUBLISH", "OWN_CAR_AGE", "FLAG_MOBIL", "FLAG_EMP_PHONE",
+     "FLAG_WORK_PHONE", "FLAG_CONT_MOBILE", "FLAG_PHONE", "FLAG_EMAIL", "OCCUPATION_TYPE",
+     "CNT_FAM_MEMBERS", "REGION_RATING_CLIENT", "REGION_RATING_CLIENT_W_CITY",
+     "WEEKDAY_APPR_PROCESS_START", "HOUR_APPR_PROCESS_START", "REG_REGION_NOT_LIVE_REGION",
+     "REG_REGION_NOT_WORK_REGION", "LIVE_REGION_NOT_WORK_REGION", "REG_CITY_NOT_LIVE_CITY",
+     "REG_CITY_NOT_WORK_CITY", "LIVE_CITY_NOT_WORK_CITY", "ORGANIZATION_TYPE",
+     "EXT_SOURCE_1", "EXT_SOURCE_2", "EXT_SOURCE_3"]
+    + [f"{col}_{stat}" for stat in ("AVG", "MODE", "MEDI") for col in BUILDING_COLUMNS]
+    + ["FONDKAPREMONT_MODE", "HOUSETYPE_MODE", "TOTALAREA_MODE", "WALLSMATERIAL_MODE",
+       "EMERGENCYSTATE_MODE", "OBS_30_CNT_SOCIAL_CIRCLE", "DEF_30_CNT_SOCIAL_CIRCLE",
+       "OBS_60_CNT_SOCIAL_CIRCLE", "DEF_60_CNT_SOCIAL_CIRCLE", "DAYS_LAST_PHONE_CHANGE"]
+    + [f"FLAG_DOCUMENT_{i}" for i in range(2, 22)]
+    + CREDIT_BUREAU_COLUMNS
+)
+
+
+def with_missing(rng, values, rate):
+    values = values.astype(float)
+    values[rng.random(len(values)) < rate] = np.nan
+    return values
+
+
+def generate_chunk(n, first_id, seed):
+    """Generate ``n`` synthetic applicants starting at SK_ID_CURR ``first_id``."""
+    rng = np.random.default_rng(seed)
+    data = {"SK_ID_CURR": np.arange(first_id, first_id + n, dtype=np.int64)}
+
+    for col, (cats, probs) in CATEGORICALS.items():
+        probs = np.asarray(probs) / np.sum(probs)
+        data[col] = np.asarray(cats, dtype=object)[rng.choice(len(cats), size=n, p=probs)]
+
+    not_employed = np.isin(data["NAME_INCOME_TYPE"], NOT_EMPLOYED)
+    data["ORGANIZATION_TYPE"][not_employed] = "XNA"
+    data["OCCUPATION_TYPE"][not_employed | (rng.random(n) < OCCUPATION_MISSING)] = None
+    for col, share in FLAG_COLUMNS.items():
+        data[col] = (rng.random(n) < share).astype(np.int64)
+    data["FLAG_EMP_PHONE"] = (~not_employed).astype(np.int64)
+
+    data["CNT_CHILDREN"] = np.minimum(rng.geometric(0.7, size=n) - 1, 19)
+    data["AMT_INCOME_TOTAL"] = np.round(rng.lognormal(np.log(147150), 0.5, size=n), -2)
+    credit = np.round(rng.lognormal(np.log(513531), 0.6, size=n), -1).clip(45000, 4_050_000)
+    data["AMT_CREDIT"] = credit
+    data["AMT_ANNUITY"] = with_missing(rng, np.round(credit / rng.uniform(10, 45, size=n), 1), 0.00004)
+    data["AMT_GOODS_PRICE"] = with_missing(rng, np.round(credit * rng.uniform(0.8, 1.0, size=n), -3), 0.0009)
+    data["REGION_POPULATION_RELATIVE"] = rng.uniform(0.00029, 0.0725, size=n).round(6)
+
+    days_birth = -rng.integers(7489, 25229, size=n)
+    data["DAYS_BIRTH"] = days_birth
+    employed = -np.minimum(rng.exponential(2400, size=n).astype(np.int64), -days_birth - 6570)
+    data["DAYS_EMPLOYED"] = np.where(not_employed, DAYS_EMPLOYED_SENTINEL, employed)
+    data["DAYS_REGISTRATION"] = -rng.uniform(0, 24672, size=n).round()
+    data["DAYS_ID_PUBLISH"] = -rng.integers(0, 7197, size=n)
+    data["OWN_CAR_AGE"] = with_missing(rng, rng.integers(0, 65, size=n), 0.6599)
+    data["CNT_FAM_MEMBERS"] = with_missing(
+        rng, data["CNT_CHILDREN"] + 1 + (data["NAME_FAMILY_STATUS"] == "Married"), 0.00001
+    )
+    rating = rng.choice([1, 2, 3], size=n, p=[0.105, 0.738, 0.157])
+    data["REGION_RATING_CLIENT"] = rating
+    # the city-adjusted rating differs from the region rating for ~5% of rows
+    data["REGION_RATING_CLIENT_W_CITY"] = np.where(
+        rng.random(n) < 0.05, np.clip(rating + rng.choice([-1, 1], size=n), 1, 3), rating
+    )
+    data["HOUR_APPR_PROCESS_START"] = rng.integers(0, 24, size=n)
+
+    ext = rng.beta(4, 3, size=(n, 3))
+    data["EXT_SOURCE_1"] = with_missing(rng, ext[:, 0], 0.5638)
+    data["EXT_SOURCE_2"] = with_missing(rng, ext[:, 1], 0.0021)
+    data["EXT_SOURCE_3"] = with_missing(rng, ext[:, 2], 0.1983)
+
+    for col, rate in BUILDING_COLUMNS.items():
+        avg = with_missing(rng, rng.random(n), rate)
+        data[f"{col}_AVG"] = avg.round(4)
+        data[f"{col}_MODE"] = (avg + rng.normal(0, 0.01, size=n)).clip(0, 1).round(4)
+        data[f"{col}_MEDI"] = (avg + rng.normal(0, 0.005, size=n)).clip(0, 1).round(4)
+    data["TOTALAREA_MODE"] = with_missing(rng, rng.random(n).round(4), TOTALAREA_MISSING)
+
+    obs_30 = rng.poisson(1.42, size=n)
+    def_30 = rng.binomial(obs_30, 0.1)
+    social_missing = rng.random(n) < SOCIAL_CIRCLE_MISSING
+    for col, values in [
+        ("OBS_30_CNT_SOCIAL_CIRCLE", obs_30),
+        ("DEF_30_CNT_SOCIAL_CIRCLE", def_30),
+        ("OBS_60_CNT_SOCIAL_CIRCLE", obs_30 - rng.binomial(obs_30, 0.01)),
+        ("DEF_60_CNT_SOCIAL_CIRCLE", def_30 - rng.binomial(def_30, 0.3)),
+    ]:
+        data[col] = np.where(social_missing, np.nan, values)
+    data["DAYS_LAST_PHONE_CHANGE"] = -np.minimum(rng.exponential(960, size=n), 4292).round()
+    for col in CREDIT_BUREAU_COLUMNS:
+        data[col] = with_missing(rng, rng.poisson(0.3, size=n), CREDIT_BUREAU_MISSING)
+    for i in range(2, 22):
+        data[f"FLAG_DOCUMENT_{i}"] = (rng.random(n) < (0.71 if i == 3 else 0.01)).astype(np.int64)
+
+    # Defaults lean towards low external scores and younger applicants so the
+    # correlation page has real signal; rescaling keeps the ~8% rate.
+    score = -2.6 - 8.0 * (ext.mean(axis=1) - 0.57) + (days_birth + 16000) / 8000
+    prob = 1 / (1 + np.exp(-score))
+    prob = np.minimum(prob * DEFAULT_RATE / prob.mean(), 1.0)
+    target = (rng.random(n) < prob).astype(np.int64)
+
+    data["TARGET"] = target
+    return pd.DataFrame(data, columns=COLUMNS)
+
+
+def write_synthetic_csv(path, rows, seed=0, chunk_rows=CHUNK_ROWS):
+    """Write ``rows`` synthetic applicants to ``path`` in bounded-memory chunks."""
+    written = 0
+    while written < rows:
+        n = min(chunk_rows, rows - written)
+        chunk = generate_chunk(n, FIRST_ID + written, seed + written // chunk_rows)
+        chunk.to_csv(path, mode="w" if written == 0 else "a", header=written == 0, index=False)
+        written += n
+    return path
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Generate a synthetic application_train.csv.")
+    parser.add_argument("--rows", type=int, default=300_000, help="number of applicants")
+    parser.add_argument("--out", default="synthetic_application_train.csv", help="output CSV path")
+    parser.add_argument("--seed", type=int, default=0, help="random seed")
+    args = parser.parse_args()
+    write_synthetic_csv(args.out, args.rows, seed=args.seed)
+    print(f"Wrote {args.rows:,} rows to {args.out}")
@@ -0,0 +1,110 @@
+import json
+import math
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import benchmark
+import import_budget
+import perf
+from export_snapshot import to_jsonable
+
+
+@pytest.fixture
+def fresh_perf(monkeypatch):
+    monkeypatch.setattr(perf, "ENABLED", True)
+    monkeypatch.setattr(perf, "ALLOC", False)
+    monkeypatch.setattr(perf, "_totals", {})
+    monkeypatch.setattr(perf, "_history", perf.deque(maxlen=3))
+    monkeypatch.setattr(perf, "JSONL_PATH", None)
+    monkeypatch.setattr(perf, "show_sidebar", lambda rerun: None)
+    return perf
+
+
+def rerun(page, stage):
+    perf.begin(page)
+    perf.lap(stage)
+    perf.finish()
+
+
+# ------------------------------
+# perf.py
+# ------------------------------
+def test_label_escapes_backslash_quote_and_newline():
+    assert perf._label('a\\b"c\nd') == 'a\\\\b\\"c\\nd'
+
+
+def test_prometheus_labels_are_escaped(fresh_perf):
+    rerun('ho"me', 'chart:"x"')
+    assert 'page="ho\\"me",stage="chart:\\"x\\""' in perf.prometheus_text()
+
+
+def test_prometheus_counters_outlive_the_history(fresh_perf):
+    for _ in range(5):
+        rerun("home", "kpis")
+    assert len(perf._history) == 3
+    assert 'dashboard_stage_runs_total{page="home",stage="kpis"} 5' in perf.prometheus_text()
+
+
+def test_alloc_metric_only_with_alloc_tracking(fresh_perf):
+    rerun("home", "kpis")
+    assert perf._history[-1]["stages"][0]["alloc_bytes"] is None
+    assert "dashboard_stage_alloc_bytes_total" not in perf.prometheus_text()
+
+
+# ------------------------------
+# export_snapshot.py
+# ------------------------------
+def test_to_jsonable_maps_non_finite_floats_to_null():
+    values = {"nan": np.nan, "inf": np.inf, "-inf": -math.inf, "ok": np.float64(1.5), "n": np.int64(3)}
+    result = to_jsonable(pd.Series(values))
+    assert result == {"nan": None, "inf": None, "-inf": None, "ok": 1.5, "n": 3.0}
+    json.dumps(result, allow_nan=False)
+
+
+# ------------------------------
+# benchmark.py
+# ------------------------------
+def stage(wall_s, peak_mb):
+    return {"wall_s": wall_s, "peak_mb": peak_mb}
+
+
+def test_find_regressions_needs_tolerance_and_noise_floor():
+    baseline = {"300000": {"a": stage(1.0, 100), "b": stage(0.01, 1)}}
+    results = {"300000": {"a": stage(1.2, 100), "b": stage(0.04, 10)}}
+    # +20% is inside the tolerance; b is +300% but under both noise floors
+    assert benchmark.find_regressions(results, baseline) == []
+
+    results["300000"]["a"] = stage(1.5, 200)
+    assert benchmark.find_regressions(results, baseline) == [
+        "300000 rows / a: wall_s 1.0 -> 1.5",
+        "300000 rows / a: peak_mb 100 -> 200",
+    ]
+
+
+def test_find_regressions_flags_stages_missing_from_results():
+    baseline = {"300000": {"a": stage(1.0, 100), "gone": stage(1.0, 100)}}
+    results = {"300000": {"a": stage(1.0, 100)}}
+    assert benchmark.find_regressions(results, baseline) == [
+        "300000 rows / gone: in the baseline but not measured",
+    ]
+
+
+# ------------------------------
+# import_budget.py
+# ------------------------------
+def test_missing_third_party_package_is_skipped(tmp_path):
+    error = "ModuleNotFoundError: No module named 'sklearn.linear_model'"
+    assert import_budget.missing_package(error, str(tmp_path)) == "sklearn"
+
+
+def test_missing_local_module_and_other_errors_are_not_skipped(tmp_path):
+    (tmp_path / "utils").mkdir()
+    (tmp_path / "perf.py").write_text("")
+    for error in [
+        "ModuleNotFoundError: No module named 'utils.page_data'",
+        "ModuleNotFoundError: No module named 'perf'",
+        "ImportError: cannot import name 'home_kpis' from 'utils.page_data'",
+    ]:
+        assert import_budget.missing_package(error, str(tmp_path)) is None
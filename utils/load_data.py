@@ -0,0 +1,11 @@
+import os
+
+import pandas as pd
+
+# DASHBOARD_CSV points the pages at another copy of application_train.csv
+# (e.g. a synthetic one from synthetic_data.py).
+CSV_PATH = os.environ.get("DASHBOARD_CSV", "C:\\Users\\ADMIN\\OneDrive\\Desktop\\project\\application_train.csv")
+
+
+def load_data(path=CSV_PATH):
+    return pd.read_csv(path)
@@ -0,0 +1,253 @@
+# Chart drawing for every dashboard page, shared by the Streamlit pages and
+# export_snapshot.py. Each ``<page>_charts(df, chart_data)`` generator yields
+# ``(title, fig)`` in page order; ``chart_data`` is the result of the page's
+# chart_data stage in utils/page_data.py.
+from startup import lazy_import, load
+
+# Plotting is imported on first use in lazy startup mode; loading pyplot
+# also loads seaborn so the whitegrid style applies to every chart.
+sns = lazy_import("seaborn", on_load=lambda sns: sns.set(style="whitegrid"))
+plt = lazy_import("matplotlib.pyplot", on_load=lambda plt: load(sns))
+
+TARGET_LABELS = ['Repaid (0)', 'Default (1)']
+
+
+# ------------------------------
+# Page: home.py (one generator per tab)
+# ------------------------------
+def home_overview_charts(df, chart_data):
+    fig, ax = plt.subplots()
+    chart_data["target_counts"].plot.pie(
+        autopct='%1.1f%%',
+        labels=['Repaid', 'Default'],
+        ax=ax
+    )
+    ax.set_title("Target Distribution")
+    yield "Target Distribution", fig
+
+    fig, ax = plt.subplots(figsize=(8, 4))
+    chart_data["missing"].plot(kind='bar', ax=ax)
+    ax.set_title("Top 20 Features by Missing %")
+    ax.set_ylabel("% Missing")
+    yield "Top 20 Features by Missing %", fig
+
+
+def home_risk_charts(df, chart_data):
+    for key, title in [
+        ("default_by_gender", "Default Rate by Gender (%)"),
+        ("default_by_education", "Default Rate by Education (%)"),
+    ]:
+        fig, ax = plt.subplots()
+        chart_data[key].plot(kind='bar', ax=ax)
+        ax.set_title(title)
+        yield title, fig
+
+
+def home_correlation_charts(df, chart_data):
+    fig, ax = plt.subplots(figsize=(6, 4))
+    sns.heatmap(chart_data["heatmap"], annot=True, cmap="coolwarm", vmin=-1, vmax=1, ax=ax)
+    yield "Correlation Heatmap", fig
+
+
+def home_charts(df, chart_data):
+    yield from home_overview_charts(df, chart_data)
+    yield from home_risk_charts(df, chart_data)
+    yield from home_correlation_charts(df, chart_data)
+
+
+# ------------------------------
+# Page: overview.py
+# ------------------------------
+def overview_charts(df, chart_data):
+    fig, ax = plt.subplots()
+    chart_data["target_counts"].plot.pie(
+        autopct='%1.1f%%',
+        labels=['Repaid', 'Default'],
+        ax=ax
+    )
+    ax.set_title("Target Distribution")
+    yield "Target Distribution", fig
+
+    fig, ax = plt.subplots(figsize=(10, 5))
+    chart_data["missing"].plot(kind='bar', ax=ax)
+    ax.set_title("Top 20 Features by Missing %")
+    ax.set_ylabel("% Missing")
+    yield "Top 20 Features by Missing %", fig
+
+    for col, title, bins, xlim in [
+        ('AGE_YEARS', "Age Distribution", 30, None),
+        ('AMT_INCOME_TOTAL', "Income Distribution", 50, 500000),
+        ('AMT_CREDIT', "Credit Amount Distribution", 50, 2000000),
+    ]:
+        fig, ax = plt.subplots()
+        sns.histplot(df[col], bins=bins, ax=ax)
+        ax.set_title(title)
+        if xlim:
+            ax.set_xlim(0, xlim)
+        yield title, fig
+
+    for col, title, xlim in [
+        ('AMT_INCOME_TOTAL', "Income Boxplot", 500000),
+        ('AMT_CREDIT', "Credit Amount Boxplot", 2000000),
+    ]:
+        fig, ax = plt.subplots()
+        sns.boxplot(x=df[col], ax=ax)
+        ax.set_title(title)
+        ax.set_xlim(0, xlim)
+        yield title, fig
+
+    fig, ax = plt.subplots()
+    sns.countplot(x='CODE_GENDER', data=df, ax=ax)
+    ax.set_title("Applicants by Gender")
+    yield "Applicants by Gender", fig
+
+    for col, order, title in [
+        ('NAME_FAMILY_STATUS', "family_order", "Applicants by Family Status"),
+        ('NAME_EDUCATION_TYPE', "education_order", "Applicants by Education Level"),
+    ]:
+        fig, ax = plt.subplots()
+        sns.countplot(x=col, data=df, order=chart_data[order], ax=ax)
+        ax.set_title(title)
+        ax.set_xticks(ax.get_xticks(), ax.get_xticklabels(), rotation=45)
+        yield title, fig
+
+
+# ------------------------------
+# Page: target.py
+# ------------------------------
+def target_charts(df, chart_data):
+    fig, ax = plt.subplots()
+    sns.countplot(x='TARGET', data=df, order=[0, 1], ax=ax, color="cyan", saturation=0.75)
+    ax.set_xticks([0, 1], TARGET_LABELS)
+    ax.set_title('Counts: Repaid vs Default')
+    yield 'Counts: Repaid vs Default', fig
+
+    for key, label, color, rotation in [
+        ("default_by_gender", "Gender", "green", None),
+        ("default_by_education", "Education", "blue", 30),
+        ("default_by_family", "Family Status", None, 30),
+        ("default_by_housing", "Housing Type", "orange", 30),
+    ]:
+        title = f'Default Rate (%) by {label}'
+        fig, ax = plt.subplots()
+        chart_data[key].plot(kind='bar', ax=ax, color=color)
+        ax.set_title(title)
+        ax.set_ylabel('Default Rate (%)')
+        if rotation:
+            ax.set_xticks(ax.get_xticks(), ax.get_xticklabels(), rotation=rotation)
+        yield title, fig
+
+    for col, title, color in [
+        ('AMT_INCOME_TOTAL', 'Income Distribution by Target (log scale)', "magenta"),
+        ('AMT_CREDIT', 'Credit Amount by Target (log scale)', "brown"),
+    ]:
+        fig, ax = plt.subplots()
+        sns.boxplot(x='TARGET', y=col, data=df, ax=ax, color=color)
+        ax.set_yscale('log')
+        ax.set_xticks([0, 1], TARGET_LABELS)
+        ax.set_title(title)
+        yield title, fig
+
+    fig, ax = plt.subplots()
+    sns.violinplot(x='TARGET', y='AGE_YEARS', data=df, inner='quartile', ax=ax, color="red")
+    ax.set_xticks([0, 1], TARGET_LABELS)
+    ax.set_title('Age Distribution by Target')
+    yield 'Age Distribution by Target', fig
+
+    fig, ax = plt.subplots(figsize=(8, 5))
+    chart_data["emp_counts"].plot(kind='bar', stacked=True, ax=ax, color="purple")
+    ax.set_title('Employment Years (binned) by Target')
+    ax.set_xlabel('Employment Years (bins)')
+    ax.set_ylabel('Count')
+    ax.legend(title='TARGET', labels=TARGET_LABELS)
+    yield 'Employment Years (binned) by Target', fig
+
+    fig, ax = plt.subplots(figsize=(6, 5))
+    chart_data["contract_counts"].plot(kind='bar', stacked=True, ax=ax, color="yellow")
+    ax.set_title('Contract Type vs Target (stacked)')
+    ax.set_ylabel('Count')
+    ax.set_xticks(ax.get_xticks(), ax.get_xticklabels(), rotation=0)
+    ax.legend(title='TARGET', labels=TARGET_LABELS)
+    yield 'Contract Type vs Target (stacked)', fig
+
+
+# ------------------------------
+# Page: financial.py
+# ------------------------------
+def financial_charts(df, chart_data):
+    for key, label, color in [
+        ("income", "Income", "#595f84"),
+        ("credit", "Credit", "#a11968"),
+        ("annuity", "Annuity", "#D57E1B"),
+    ]:
+        fig, ax = plt.subplots(figsize=(10, 5))
+        ax.hist(chart_data[key], bins=50, alpha=1, color=color, label=label)
+        ax.set_xlabel(label)
+        ax.set_ylabel("Count")
+        ax.legend()
+        yield f"{label} Distribution", fig
+
+    for col, label, color in [
+        ("AMT_CREDIT", "Credit", "#2E9F45"),
+        ("AMT_ANNUITY", "Annuity", "#ff7f0e"),
+    ]:
+        fig, ax = plt.subplots(figsize=(10, 5))
+        ax.scatter(df["AMT_INCOME_TOTAL"], df[col], alpha=0.3, color=color, label="Applicants")
+        ax.set_xlabel("Income")
+        ax.set_ylabel(label)
+        ax.grid(True)
+        ax.legend()
+        yield f"Income vs {label}", fig
+
+    for key, label in [("credit_by_target", "Credit"), ("income_by_target", "Income")]:
+        fig, ax = plt.subplots(figsize=(10, 5))
+        ax.boxplot(chart_data[key])
+        ax.set_xticks([1, 2], ["Repaid (0)", "Default (1)"])
+        ax.set_ylabel(label)
+        ax.grid(True)
+        yield f"{label} by Target", fig
+
+    fig, ax = plt.subplots(figsize=(10, 5))
+    ax.hist2d(df["AMT_INCOME_TOTAL"], df["AMT_CREDIT"], bins=50, cmap="Blues")
+    ax.set_xlabel("Income")
+    ax.set_ylabel("Credit")
+    yield "Joint Income–Credit (Density Approximation)", fig
+
+    fig, ax = plt.subplots(figsize=(10, 5))
+    chart_data["default_rate_by_bracket"].plot(kind="bar", ax=ax, color="#1f77b4", alpha=1)
+    ax.set_xlabel("Income Bracket")
+    ax.set_ylabel("Default Rate (%)")
+    yield "Income Brackets vs Default Rate", fig
+
+    corr = chart_data["corr"]
+    fig, ax = plt.subplots(figsize=(10, 5))
+    cax = ax.matshow(corr, cmap="coolwarm")
+    fig.colorbar(cax)
+    ax.set_xticks(range(len(corr.columns)), corr.columns, rotation=45)
+    ax.set_yticks(range(len(corr.columns)), corr.columns)
+    yield "Correlation Heatmap (Financial Variables)", fig
+
+
+# ------------------------------
+# Page: corelation.py
+# ------------------------------
+def correlation_charts(df, chart_data):
+    fig, ax = plt.subplots(figsize=(6, 4))
+    sns.heatmap(chart_data["heatmap"], annot=True, fmt=".2f", cmap="coolwarm", vmin=-1, vmax=1, ax=ax)
+    yield "Heatmap of Key Correlations", fig
+
+    fig, ax = plt.subplots(figsize=(8, 4))
+    sns.histplot(chart_data["corr_series"], bins=30, kde=False, ax=ax, color="magenta")
+    ax.set_title("Distribution of Correlations with TARGET")
+    ax.set_xlabel("Correlation with TARGET")
+    ax.set_ylabel("Feature Count")
+    yield "Distribution of Feature Correlations with TARGET", fig
+
+
+CHARTS = {
+    "home": home_charts,
+    "overview": overview_charts,
+    "target": target_charts,
+    "financial": financial_charts,
+    "correlation": correlation_charts,
+}
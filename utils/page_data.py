@@ -0,0 +1,398 @@
+# Data computations behind every dashboard page.
+#
+# The Streamlit pages, export_snapshot.py and benchmark.py all call these
+# functions, so the snapshot shows what the pages show and the benchmark times
+# what the pages run. Per page there is a ``<page>_features(df)`` step and a
+# list of stages (kpis, aggregation, correlation, chart_data). Each stage is
+# called as ``stage(df, data)``, where ``data`` maps the names of the stages
+# run so far to their results, and returns a dict. Result dicts may carry a
+# "tables" entry of label -> Series for values the page shows with st.table.
+# ``<PAGE>_KPI_FORMATS`` holds the display format of every KPI the page shows;
+# the pages and the snapshot both render KPIs through format_kpis().
+import pandas as pd
+import numpy as np
+
+DAYS_EMPLOYED_SENTINEL = 365243
+HEATMAP_COLS = ['TARGET', 'AGE_YEARS', 'EMPLOYMENT_YEARS', 'AMT_INCOME_TOTAL', 'AMT_CREDIT']
+EMPLOYMENT_BINS = [0, 1, 3, 5, 10, 20, 40, 100]
+
+
+def default_rate_by(df, col):
+    return df.groupby(col)['TARGET'].mean() * 100
+
+
+def format_kpis(kpis, formats):
+    """KPI name -> display string, in the order of ``formats``."""
+    return {name: fmt.format(kpis[name]) for name, fmt in formats.items()}
+
+
+# ------------------------------
+# Page: home.py
+# ------------------------------
+def home_features(df):
+    df['AGE_YEARS'] = (df['DAYS_BIRTH'].abs() / 365).astype(int)
+    df['DAYS_EMPLOYED'] = df['DAYS_EMPLOYED'].replace(DAYS_EMPLOYED_SENTINEL, np.nan)
+    df['EMPLOYMENT_YEARS'] = (df['DAYS_EMPLOYED'].abs() / 365).replace([np.inf, 0], np.nan)
+    df['TARGET'] = df['TARGET'].astype(int)
+    df['CNT_CHILDREN'] = df['CNT_CHILDREN'].apply(lambda x: 0 if pd.isna(x) or x < 0 else int(x))
+    df['CNT_FAM_MEMBERS'] = pd.to_numeric(df['CNT_FAM_MEMBERS'], errors='coerce')
+    return df
+
+
+HOME_KPI_FORMATS = {
+    # Tab 1: Overview & Data Quality
+    "Total Applicants": "{}",
+    "Default Rate (%)": "{:.2f}",
+    "Repaid Rate (%)": "{:.2f}",
+    "Total Features": "{}",
+    "Avg Missing per Feature (%)": "{:.2f}",
+    # Tab 2: Default Risk Segmentation
+    "Total Defaults": "{}",
+    "Avg Income (Defaulters)": "{:.2f}",
+    "Avg Credit (Defaulters)": "{:.2f}",
+    "Avg Annuity (Defaulters)": "{:.2f}",
+    "Avg Employment Years (Defaulters)": "{:.2f}",
+    # Tab 3: Demographics & Employment
+    "Avg Age - Defaulters": "{:.2f}",
+    "Avg Age - Non-Defaulters": "{:.2f}",
+    "% With Children": "{:.2f}",
+}
+
+
+def home_kpis(df, data=None):
+    defaulters = df['TARGET'] == 1
+
+    # Tab 4 shows the financial KPIs as a table
+    fin = df[["AMT_INCOME_TOTAL", "AMT_CREDIT", "AMT_ANNUITY", "AMT_GOODS_PRICE", "TARGET"]].replace({0: np.nan})
+    fin["DTI"] = fin["AMT_ANNUITY"] / fin["AMT_INCOME_TOTAL"]
+    fin["LTI"] = fin["AMT_CREDIT"] / fin["AMT_INCOME_TOTAL"]
+    financial = {
+        "Avg Income": fin["AMT_INCOME_TOTAL"].mean(),
+        "Avg Credit": fin["AMT_CREDIT"].mean(),
+        "Avg Annuity": fin["AMT_ANNUITY"].mean(),
+        "Avg DTI": fin["DTI"].mean(),
+        "Avg LTI": fin["LTI"].mean(),
+    }
+    return {
+        # Tab 1: Overview & Data Quality
+        "Total Applicants": df['SK_ID_CURR'].nunique(),
+        "Default Rate (%)": df['TARGET'].mean() * 100,
+        "Repaid Rate (%)": 100 - df['TARGET'].mean() * 100,
+        "Total Features": df.shape[1],
+        "Avg Missing per Feature (%)": df.isnull().mean().mean() * 100,
+        # Tab 2: Default Risk Segmentation
+        "Total Defaults": int(df['TARGET'].sum()),
+        "Avg Income (Defaulters)": df.loc[defaulters, 'AMT_INCOME_TOTAL'].mean(),
+        "Avg Credit (Defaulters)": df.loc[defaulters, 'AMT_CREDIT'].mean(),
+        "Avg Annuity (Defaulters)": df.loc[defaulters, 'AMT_ANNUITY'].mean(),
+        "Avg Employment Years (Defaulters)": df.loc[defaulters, 'EMPLOYMENT_YEARS'].mean(),
+        # Tab 3: Demographics & Employment
+        "Avg Age - Defaulters": df.loc[defaulters, 'AGE_YEARS'].mean(),
+        "Avg Age - Non-Defaulters": df.loc[~defaulters, 'AGE_YEARS'].mean(),
+        "% With Children": df['CNT_CHILDREN'].gt(0).mean() * 100,
+        "tables": {"Key Financial KPIs": pd.Series(financial, name="Value")},
+    }
+
+
+def home_aggregations(df, data=None):
+    return {
+        "default_by_gender": default_rate_by(df, 'CODE_GENDER'),
+        "default_by_education": default_rate_by(df, 'NAME_EDUCATION_TYPE'),
+        "default_by_family": default_rate_by(df, 'NAME_FAMILY_STATUS'),
+        "default_by_housing": default_rate_by(df, 'NAME_HOUSING_TYPE'),
+    }
+
+
+def home_correlations(df, data=None):
+    numeric_df = df.select_dtypes(include=['int64', 'float64']).copy()
+    # AGE_YEARS is a platform int (int32 on Windows), so add it explicitly
+    numeric_df['AGE_YEARS'] = df['AGE_YEARS']
+    numeric_df['EMPLOYMENT_YEARS'] = df['EMPLOYMENT_YEARS']
+    corr = numeric_df.corr()
+    corr_series = corr['TARGET'].drop('TARGET').sort_values()
+    return {
+        "heatmap": corr.loc[HEATMAP_COLS, HEATMAP_COLS],
+        "tables": {"Top Correlations with TARGET": pd.concat([corr_series.head(5), corr_series.tail(5)])},
+    }
+
+
+def home_chart_data(df, data):
+    aggregation = data["aggregation"]
+    return {
+        "target_counts": df['TARGET'].value_counts(),
+        "missing": df.isnull().mean().sort_values(ascending=False)[:20] * 100,
+        "default_by_gender": aggregation["default_by_gender"].sort_values(ascending=False),
+        "default_by_education": aggregation["default_by_education"].sort_values(ascending=False),
+        "heatmap": data["correlation"]["heatmap"],
+    }
+
+
+# ------------------------------
+# Page: overview.py
+# ------------------------------
+def overview_features(df):
+    df['AGE_YEARS'] = abs(df['DAYS_BIRTH']) // 365  # Age
+    df['DAYS_EMPLOYED'] = df['DAYS_EMPLOYED'].replace(DAYS_EMPLOYED_SENTINEL, np.nan)
+    return df
+
+
+OVERVIEW_KPI_FORMATS = {
+    "Total Applicants": "{}",
+    "Default Rate (%)": "{:.2f}",
+    "Repaid Rate (%)": "{:.2f}",
+    "Total Features": "{}",
+    "Avg Missing per Feature (%)": "{:.2f}",
+    "Numerical Features": "{}",
+    "Categorical Features": "{}",
+    "Median Age (Years)": "{:.0f}",
+    "Median Annual Income": "{:,.0f}",
+    "Average Credit Amount": "{:,.0f}",
+}
+
+
+def overview_kpis(df, data=None):
+    return {
+        "Total Applicants": df['SK_ID_CURR'].nunique(),
+        "Default Rate (%)": df['TARGET'].mean() * 100,
+        "Repaid Rate (%)": (1 - df['TARGET'].mean()) * 100,
+        "Total Features": df.shape[1],
+        "Avg Missing per Feature (%)": df.isnull().mean().mean() * 100,
+        "Numerical Features": len(df.select_dtypes(include=[np.number]).columns),
+        "Categorical Features": len(df.select_dtypes(exclude=[np.number]).columns),
+        "Median Age (Years)": df['AGE_YEARS'].median(),
+        "Median Annual Income": df['AMT_INCOME_TOTAL'].median(),
+        "Average Credit Amount": df['AMT_CREDIT'].mean(),
+    }
+
+
+def overview_chart_data(df, data=None):
+    return {
+        "target_counts": df['TARGET'].value_counts(),
+        "missing": df.isnull().mean().sort_values(ascending=False)[:20] * 100,
+        "family_order": df['NAME_FAMILY_STATUS'].value_counts().index,
+        "education_order": df['NAME_EDUCATION_TYPE'].value_counts().index,
+    }
+
+
+# ------------------------------
+# Page: target.py
+# ------------------------------
+def target_features(df):
+    df['AGE_YEARS'] = (df['DAYS_BIRTH'].abs() / 365).astype(int)
+    df['DAYS_EMPLOYED'] = df['DAYS_EMPLOYED'].replace(DAYS_EMPLOYED_SENTINEL, np.nan)
+    df['EMPLOYMENT_YEARS'] = (df['DAYS_EMPLOYED'].abs() / 365).replace(np.inf, np.nan)
+    df['TARGET'] = df['TARGET'].astype(int)
+    return df
+
+
+TARGET_KPI_FORMATS = {
+    "Total Defaults": "{}",
+    "Default Rate (%)": "{:.2f}%",
+    "Avg Income (Defaulters)": "{:.2f}",
+    "Avg Credit (Defaulters)": "{:.2f}",
+    "Avg Annuity (Defaulters)": "{:.2f}",
+    "Avg Employment Years (Defaulters)": "{:.2f}",
+}
+
+
+def target_kpis(df, data=None):
+    defaulters = df['TARGET'] == 1
+    return {
+        "Total Defaults": int(df['TARGET'].sum()),
+        "Default Rate (%)": df['TARGET'].mean() * 100,
+        "Avg Income (Defaulters)": df.loc[defaulters, 'AMT_INCOME_TOTAL'].mean(),
+        "Avg Credit (Defaulters)": df.loc[defaulters, 'AMT_CREDIT'].mean(),
+        "Avg Annuity (Defaulters)": df.loc[defaulters, 'AMT_ANNUITY'].mean(),
+        "Avg Employment Years (Defaulters)": df.loc[defaulters, 'EMPLOYMENT_YEARS'].mean(),
+    }
+
+
+def target_aggregations(df, data=None):
+    employ_bin = pd.cut(df['EMPLOYMENT_YEARS'], bins=EMPLOYMENT_BINS, include_lowest=True)
+    return {
+        "default_by_gender": default_rate_by(df, 'CODE_GENDER').round(2),
+        "default_by_education": default_rate_by(df, 'NAME_EDUCATION_TYPE').round(2),
+        "default_by_family": default_rate_by(df, 'NAME_FAMILY_STATUS').round(2),
+        "default_by_housing": default_rate_by(df, 'NAME_HOUSING_TYPE').round(2),
+        "emp_counts": df.groupby([employ_bin, 'TARGET'], observed=False).size().unstack(fill_value=0),
+        "contract_counts": df.groupby(['NAME_CONTRACT_TYPE', 'TARGET']).size().unstack(fill_value=0),
+    }
+
+
+def target_chart_data(df, data):
+    aggregation = data["aggregation"]
+    return {
+        "default_by_gender": aggregation["default_by_gender"].sort_values(ascending=False),
+        "default_by_education": aggregation["default_by_education"].sort_values(ascending=False),
+        "default_by_family": aggregation["default_by_family"].sort_values(ascending=False),
+        "default_by_housing": aggregation["default_by_housing"].sort_values(ascending=False),
+        "emp_counts": aggregation["emp_counts"],
+        "contract_counts": aggregation["contract_counts"],
+    }
+
+
+# ------------------------------
+# Page: financial.py
+# ------------------------------
+def financial_features(df):
+    df["DTI"] = df["AMT_ANNUITY"] / df["AMT_INCOME_TOTAL"]
+    df["LTI"] = df["AMT_CREDIT"] / df["AMT_INCOME_TOTAL"]
+    return df
+
+
+FINANCIAL_KPI_FORMATS = {
+    "Avg Annual Income": "{:,.0f}",
+    "Median Annual Income": "{:,.0f}",
+    "Avg Credit Amount": "{:,.0f}",
+    "Avg Annuity": "{:,.0f}",
+    "Avg Goods Price": "{:,.0f}",
+    "Avg DTI": "{:.2f}",
+    "Avg LTI": "{:.2f}",
+    "Income Gap (Non-def − Def)": "{:,.0f}",
+    "Credit Gap (Non-def − Def)": "{:,.0f}",
+    "% High Credit (>1M)": "{:.2f}%",
+}
+
+
+def financial_kpis(df, data=None):
+    repaid = df["TARGET"] == 0
+    defaulted = df["TARGET"] == 1
+    return {
+        "Avg Annual Income": df["AMT_INCOME_TOTAL"].mean(),
+        "Median Annual Income": df["AMT_INCOME_TOTAL"].median(),
+        "Avg Credit Amount": df["AMT_CREDIT"].mean(),
+        "Avg Annuity": df["AMT_ANNUITY"].mean(),
+        "Avg Goods Price": df["AMT_GOODS_PRICE"].mean(),
+        "Avg DTI": df["DTI"].mean(),
+        "Avg LTI": df["LTI"].mean(),
+        "Income Gap (Non-def − Def)": df.loc[repaid, "AMT_INCOME_TOTAL"].mean() - df.loc[defaulted, "AMT_INCOME_TOTAL"].mean(),
+        "Credit Gap (Non-def − Def)": df.loc[repaid, "AMT_CREDIT"].mean() - df.loc[defaulted, "AMT_CREDIT"].mean(),
+        "% High Credit (>1M)": (df["AMT_CREDIT"] > 1_000_000).mean() * 100,
+    }
+
+
+def financial_aggregations(df, data=None):
+    income_bracket = pd.qcut(df["AMT_INCOME_TOTAL"], q=10, duplicates="drop")
+    return {
+        "default_rate_by_bracket": df.groupby(income_bracket, observed=False)["TARGET"].mean() * 100,
+    }
+
+
+def financial_correlations(df, data=None):
+    return {
+        "corr": df[["AMT_INCOME_TOTAL", "AMT_CREDIT", "AMT_ANNUITY", "DTI", "LTI", "TARGET"]].corr(),
+    }
+
+
+def financial_chart_data(df, data):
+    by_target = [df["TARGET"] == 0, df["TARGET"] == 1]
+    return {
+        "income": df["AMT_INCOME_TOTAL"].dropna(),
+        "credit": df["AMT_CREDIT"].dropna(),
+        "annuity": df["AMT_ANNUITY"].dropna(),
+        "credit_by_target": [df.loc[mask, "AMT_CREDIT"].dropna() for mask in by_target],
+        "income_by_target": [df.loc[mask, "AMT_INCOME_TOTAL"].dropna() for mask in by_target],
+        "default_rate_by_bracket": data["aggregation"]["default_rate_by_bracket"],
+        "corr": data["correlation"]["corr"],
+    }
+
+
+# ------------------------------
+# Page: corelation.py
+# ------------------------------
+def correlation_features(df):
+    df['AGE_YEARS'] = -df['DAYS_BIRTH'] / 365.25
+    df['EMPLOYMENT_YEARS'] = df['DAYS_EMPLOYED'].clip(upper=0) / -365.25
+    return df
+
+
+def correlation_correlations(df, data=None):
+    # One pairwise .corr() over every numeric column; the KPIs and the heatmap
+    # are all read off this matrix instead of recomputing it.
+    numeric_df = df.select_dtypes(include=['int64', 'float64'])
+    corr = numeric_df.corr()
+    corr_series = corr['TARGET'].drop('TARGET').sort_values(ascending=False)
+    return {
+        "corr": corr,
+        "corr_series": corr_series,
+        "heatmap": corr.loc[HEATMAP_COLS, HEATMAP_COLS],
+        "tables": {
+            "Top 5 Positive Correlations with TARGET": corr_series[corr_series > 0].nlargest(5),
+            "Top 5 Negative Correlations with TARGET": corr_series.nsmallest(5),
+        },
+    }
+
+
+CORRELATION_KPI_FORMATS = {
+    "Most correlated with Income": "{}",
+    "Most correlated with Credit": "{}",
+    "Corr(Income, Credit)": "{:.4f}",
+    "Corr(Age, TARGET)": "{:.4f}",
+    "Corr(Employment Years, TARGET)": "{:.4f}",
+    "Corr(Family Size, TARGET)": "{:.4f}",
+    "Variance explained (Top 5 R² proxy)": "{:.4f}",
+    "# Features with |corr| > 0.5": "{}",
+}
+
+
+def correlation_kpis(df, data):
+    corr = data["correlation"]["corr"]
+    corr_series = data["correlation"]["corr_series"]
+    top5_features = corr_series.abs().sort_values(ascending=False).index[:5]
+    family_col = 'CNT_FAM_MEMBERS' if 'CNT_FAM_MEMBERS' in corr.columns else None
+    return {
+        "Most correlated with Income": corr['AMT_INCOME_TOTAL'].drop('AMT_INCOME_TOTAL').abs().idxmax(),
+        "Most correlated with Credit": corr['AMT_CREDIT'].drop('AMT_CREDIT').abs().idxmax(),
+        "Corr(Income, Credit)": corr.loc['AMT_INCOME_TOTAL', 'AMT_CREDIT'],
+        "Corr(Age, TARGET)": corr.loc['AGE_YEARS', 'TARGET'],
+        "Corr(Employment Years, TARGET)": corr.loc['EMPLOYMENT_YEARS', 'TARGET'],
+        "Corr(Family Size, TARGET)": corr.loc[family_col, 'TARGET'] if family_col else np.nan,
+        "Variance explained (Top 5 R² proxy)": (corr_series[top5_features] ** 2).sum(),
+        "# Features with |corr| > 0.5": int((corr_series.abs() > 0.5).sum()),
+    }
+
+
+def correlation_chart_data(df, data):
+    return {
+        "heatmap": data["correlation"]["heatmap"],
+        "corr_series": data["correlation"]["corr_series"],
+    }
+
+
+KPI_FORMATS = {
+    "home": HOME_KPI_FORMATS,
+    "overview": OVERVIEW_KPI_FORMATS,
+    "target": TARGET_KPI_FORMATS,
+    "financial": FINANCIAL_KPI_FORMATS,
+    "correlation": CORRELATION_KPI_FORMATS,
+}
+
+# (slug, title, features, [(stage, function), ...]) in the order the page runs them
+PAGES = [
+    ("home", "Home Credit Dashboard", home_features, [
+        ("kpis", home_kpis),
+        ("aggregation", home_aggregations),
+        ("correlation", home_correlations),
+        ("chart_data", home_chart_data),
+    ]),
+    ("overview", "Overview & Data Quality", overview_features, [
+        ("kpis", overview_kpis),
+        ("chart_data", overview_chart_data),
+    ]),
+    ("target", "Target & Risk Segmentation", target_features, [
+        ("kpis", target_kpis),
+        ("aggregation", target_aggregations),
+        ("chart_data", target_chart_data),
+    ]),
+    ("financial", "Financial Health & Affordability", financial_features, [
+        ("kpis", financial_kpis),
+        ("aggregation", financial_aggregations),
+        ("correlation", financial_correlations),
+        ("chart_data", financial_chart_data),
+    ]),
+    ("correlation", "Correlation Insights & KPIs", correlation_features, [
+        ("correlation", correlation_correlations),
+        ("kpis", correlation_kpis),
+        ("chart_data", correlation_chart_data),
+    ]),
+]
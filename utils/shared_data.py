@@ -0,0 +1,21 @@
+# The parsed dataset, shared by every page and session of the Streamlit
+# process, so only the first page view after a start (or after the CSV
+# changes) pays for pd.read_csv.
+import os
+
+import streamlit as st
+
+from utils.load_data import CSV_PATH, load_data
+
+
+# Keyed on the file's size and mtime so a refreshed CSV is re-read; one entry
+# so the previous frame is dropped when that happens.
+@st.cache_resource(max_entries=1, show_spinner="Loading application data...")
+def _parsed(path, size, mtime_ns):
+    return load_data(path)
+
+
+def shared_data(path=CSV_PATH):
+    """A private copy of the cached frame; the pages add columns to it."""
+    stat = os.stat(path)
+    return _parsed(path, stat.st_size, stat.st_mtime_ns).copy()
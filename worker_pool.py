@@ -0,0 +1,99 @@
+# Pre-warmed worker pool for batch page rendering (export_snapshot.py --workers).
+#
+# warm_pool() starts worker processes that have already imported the plotting
+# stack, built the matplotlib font cache and loaded the dataset, and stops
+# them (and removes any dataset cache file) when the ``with`` block ends. The
+# Streamlit pages don't use it: they share one parsed frame per process
+# through utils/shared_data.py.
+#
+# How workers get the dataset depends on the start method:
+#   * fork (the default on Linux before Python 3.14): the parent parses the
+#     CSV once and the workers inherit that frame copy-on-write.
+#   * spawn / forkserver (Windows, macOS, newer Linux defaults): the parent
+#     parses the CSV once and writes it to an uncompressed Feather file in the
+#     temp dir; each worker memory-maps that file instead of re-parsing the
+#     CSV. That removes the N x CSV parse time, but not the memory: string
+#     columns are still materialised per worker, and every page works on its
+#     own copy, so budget roughly (workers + 1) x the in-memory size of the
+#     dataset. Without pyarrow the file is a pickle, read in full by each
+#     worker.
+# fork is only used when it is already the interpreter's default: forcing it
+# where CPython defaults to spawn (macOS) is unsafe once the parent has
+# imported matplotlib.
+import multiprocessing
+import os
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+
+import pandas as pd
+
+from utils.load_data import load_data
+
+_dataset = None
+
+
+def dataset():
+    """The dataset loaded for the pool in this process."""
+    return _dataset
+
+
+def _write_cache(df):
+    try:
+        import pyarrow  # noqa: F401
+        suffix = ".feather"
+    except ImportError:
+        suffix = ".pkl"
+    fd, path = tempfile.mkstemp(prefix="dashboard-", suffix=suffix)
+    os.close(fd)
+    if suffix == ".feather":
+        # Uncompressed so workers can memory-map the numeric columns.
+        df.to_feather(path, compression="uncompressed")
+    else:
+        df.to_pickle(path)
+    return path
+
+
+def _read_cache(path):
+    if path.endswith(".feather"):
+        from pyarrow import feather
+        return feather.read_table(path, memory_map=True).to_pandas()
+    return pd.read_pickle(path)
+
+
+def _warm_worker(cache_path):
+    global _dataset
+    import matplotlib
+    matplotlib.use("Agg")
+    import matplotlib.pyplot as plt
+    import seaborn as sns
+
+    sns.set(style="whitegrid")
+    # Drawing text once builds the font cache so the first real chart doesn't.
+    fig, ax = plt.subplots()
+    ax.set_title("warm-up")
+    fig.canvas.draw()
+    plt.close(fig)
+
+    if cache_path is not None:
+        _dataset = _read_cache(cache_path)
+
+
+@contextmanager
+def warm_pool(csv_path, workers=None):
+    """ProcessPoolExecutor whose workers are ready to compute and render pages."""
+    global _dataset
+    # Parse the CSV once, here, whatever the start method.
+    _dataset = load_data(csv_path)
+    cache_path = None
+    if multiprocessing.get_start_method() != "fork":
+        cache_path = _write_cache(_dataset)
+    try:
+        with ProcessPoolExecutor(
+            max_workers=workers, initializer=_warm_worker, initargs=(cache_path,)
+        ) as pool:
+            yield pool
+    finally:
+        _dataset = None
+        if cache_path is not None:
+            os.remove(cache_path)